@@ -1,21 +1,89 @@
 from fastapi import FastAPI, File, UploadFile, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
+import asyncio
 import json
+import multiprocessing
+import os
 import tempfile
+import threading
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import ExitStack, asynccontextmanager
+from io import BytesIO
 from pathlib import Path
 
-from invoice_qc.extractor import InvoiceExtractor
-from invoice_qc.validator import InvoiceValidator
-from invoice_qc.schema import Invoice, LineItem
+import msgspec
+
+from invoice_qc.extractor import get_extractor
+from invoice_qc.validator import get_validator
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Start one pool of extraction workers for the life of the server.
+
+    Workers come from a forkserver (spawn where that is unavailable), never
+    from a fork of the multithreaded server, and each builds its extractor
+    once. With a single CPU, or without a PDF backend, PDFs are extracted
+    in the request thread instead.
+    """
+    app.state.extract_pool = None
+    if (os.cpu_count() or 1) > 1:
+        try:
+            app.state.extract_pool = _create_extract_pool()
+        except ImportError:
+            pass
+    try:
+        yield
+    finally:
+        if app.state.extract_pool is not None:
+            app.state.extract_pool.shutdown()
+
+
+def _create_extract_pool():
+    start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return get_extractor().create_worker_pool(os.cpu_count(), multiprocessing.get_context(start_method))
+
+
+# Serializes replacing a broken extraction pool across request threads
+_extract_pool_lock = threading.Lock()
+
+
+def extract_pdfs(pdfs: list) -> list:
+    """
+    Extract PDFs in the startup pool, or in the calling thread without one.
+
+    A worker that dies (a crash in the PDF library, an OOM kill) breaks the
+    whole pool. The PDFs of that request are reported as failed; the next
+    request finds the pool broken and replaces it with a fresh one.
+    """
+    extractor = get_extractor()
+    pool = getattr(app.state, "extract_pool", None)
+    try:
+        return extractor.extract_from_pdfs(pdfs, max_workers=1, pool=pool)
+    except BrokenProcessPool:
+        with _extract_pool_lock:
+            # Another request may have replaced it already
+            if app.state.extract_pool is pool:
+                pool.shutdown(wait=False)
+                app.state.extract_pool = _create_extract_pool()
+            pool = app.state.extract_pool
+        return extractor.extract_from_pdfs(pdfs, max_workers=1, pool=pool)
 
 
 app = FastAPI(
     title="Invoice QC Service",
     description="Invoice extraction and quality control API",
-    version="0.1.0"
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
+# Uploads below this size are parsed from memory instead of a temp file
+IN_MEMORY_UPLOAD_LIMIT = 8 * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 1024 * 1024
 
 # Add CORS middleware
 app.add_middleware(
@@ -77,6 +145,29 @@ class InvoiceExtractionResponse(BaseModel):
     validation: ValidationSummaryModel
 
 
+def _fits_in_memory(file: UploadFile) -> bool:
+    return file.size is not None and file.size < IN_MEMORY_UPLOAD_LIMIT
+
+
+async def save_upload(file: UploadFile, tmpdir: Optional[str]):
+    """
+    Read an uploaded PDF for extraction.
+
+    Small uploads stay in memory and are returned as a named BytesIO; large
+    ones are copied to tmpdir in chunks and their path is returned.
+    """
+    if _fits_in_memory(file):
+        buffer = BytesIO(await file.read())
+        buffer.name = file.filename
+        return buffer
+
+    file_path = Path(tmpdir) / file.filename
+    with open(file_path, "wb") as f:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            f.write(chunk)
+    return str(file_path)
+
+
 @app.get("/health", response_model=HealthModel)
 async def health():
     """Health check endpoint."""
@@ -97,44 +188,13 @@ async def validate_json(invoices: List[InvoiceModel]):
     if not invoices:
         raise HTTPException(status_code=400, detail="Empty invoice list")
 
-    # Convert Pydantic models to Invoice objects
-    invoice_objs = []
-    for inv_model in invoices:
-        line_items = [
-            LineItem(
-                description=item.description,
-                quantity=item.quantity,
-                unit_price=item.unit_price,
-                line_total=item.line_total,
-            )
-            for item in inv_model.line_items
-        ]
-
-        invoice = Invoice(
-            invoice_number=inv_model.invoice_number,
-            external_reference=inv_model.external_reference,
-            invoice_date=inv_model.invoice_date,
-            due_date=inv_model.due_date,
-            seller_name=inv_model.seller_name,
-            seller_address=inv_model.seller_address,
-            seller_tax_id=inv_model.seller_tax_id,
-            buyer_name=inv_model.buyer_name,
-            buyer_address=inv_model.buyer_address,
-            buyer_tax_id=inv_model.buyer_tax_id,
-            currency=inv_model.currency,
-            net_total=inv_model.net_total,
-            tax_amount=inv_model.tax_amount,
-            gross_total=inv_model.gross_total,
-            tax_rate=inv_model.tax_rate,
-            line_items=line_items,
-        )
-        invoice_objs.append(invoice)
-
-    # Validate
-    validator = InvoiceValidator()
-    summary = validator.validate_invoices(invoice_objs)
-
-    return summary
+    # Validate. The rules only read attributes, so the request models are
+    # validated as-is instead of being copied into Invoice dataclasses.
+    summary = get_validator().validate_invoices(invoices)
+
+    # The summary is plain Python data; returning the response directly skips
+    # re-validating it against response_model (kept for the OpenAPI schema).
+    return ORJSONResponse(summary)
 
 
 @app.post("/extract-and-validate-pdfs", response_model=InvoiceExtractionResponse)
@@ -148,36 +208,40 @@ async def extract_and_validate_pdfs(files: List[UploadFile] = File(...)):
     if not files:
         raise HTTPException(status_code=400, detail="No PDF files provided")
 
-    # Create temporary directory
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Save uploaded files
-        for file in files:
-            if not file.filename.lower().endswith(".pdf"):
-                raise HTTPException(status_code=400, detail="Only PDF files are allowed")
+    for file in files:
+        if not file.filename.lower().endswith(".pdf"):
+            raise HTTPException(status_code=400, detail="Only PDF files are allowed")
+
+    with ExitStack() as stack:
+        # Large uploads are streamed to a temporary directory; only create it
+        # when one of them needs it
+        tmpdir = None
+        if any(not _fits_in_memory(file) for file in files):
+            tmpdir = stack.enter_context(tempfile.TemporaryDirectory())
 
-            file_path = Path(tmpdir) / file.filename
-            content = await file.read()
-            with open(file_path, "wb") as f:
-                f.write(content)
+        # Read all uploads concurrently (a repeated file name keeps the last upload)
+        uploads = {file.filename: file for file in files}
+        saved = await asyncio.gather(*[save_upload(file, tmpdir) for file in uploads.values()])
+        pdfs = dict(zip(uploads, saved))
 
-        # Extract invoices
-        extractor = InvoiceExtractor()
-        invoices = extractor.extract_from_folder(tmpdir)
+        # Extract invoices off the event loop, so other requests keep being
+        # served; in the startup pool if there is one, else in this thread
+        invoices = await asyncio.to_thread(extract_pdfs, [pdfs[name] for name in sorted(pdfs)])
 
         if not invoices:
             raise HTTPException(status_code=400, detail="No invoices extracted from PDFs")
 
         # Validate
-        validator = InvoiceValidator()
-        summary = validator.validate_invoices(invoices)
+        summary = get_validator().validate_invoices(invoices)
 
-        # Add extracted data to results
+        # Add extracted data to results. Encoded here directly from the
+        # dataclasses, so FastAPI does not walk it through jsonable_encoder.
         extracted_data = {
-            "invoices": [inv.to_dict() for inv in invoices],
+            "invoices": invoices,
             "validation": summary
         }
 
-        return extracted_data
+        return Response(content=msgspec.json.encode(extracted_data), media_type="application/json")
 
 
 @app.get("/")
@@ -1,8 +1,10 @@
 import argparse
-import json
+import heapq
 import sys
 from pathlib import Path
 
+import orjson
+
 from invoice_qc.extractor import extract_invoices
 from invoice_qc.validator import validate_invoices
 from invoice_qc.schema import Invoice, LineItem
@@ -10,8 +12,7 @@ from invoice_qc.schema import Invoice, LineItem
 
 def load_invoices_from_json(json_file: str) -> list:
     """Load invoices from JSON file, converting nested LineItem dicts to dataclasses."""
-    with open(json_file, "r") as f:
-        data = json.load(f)
+    data = orjson.loads(Path(json_file).read_bytes())
 
     invoices = []
     for raw_invoice_data in data:
@@ -26,11 +27,19 @@ def load_invoices_from_json(json_file: str) -> list:
     return invoices
 
 
+def write_json(data, output_file: str) -> None:
+    """
+    Write data as indented UTF-8 JSON; dataclasses are serialized natively.
+
+    Non-ASCII text is written as-is rather than \\u-escaped, and NaN or
+    infinite floats become null.
+    """
+    Path(output_file).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+
 def save_invoices_to_json(invoices: list, output_file: str) -> None:
     """Save invoices to JSON file."""
-    data = [inv.to_dict() for inv in invoices]
-    with open(output_file, "w") as f:
-        json.dump(data, f, indent=2)
+    write_json(invoices, output_file)
 
 
 def print_summary(summary: dict) -> None:
@@ -44,12 +53,12 @@ def print_summary(summary: dict) -> None:
 
     if summary["error_counts"]:
         print("\nTop Error Types:")
-        sorted_errors = sorted(
+        top_errors = heapq.nlargest(
+            10,
             summary["error_counts"].items(),
-            key=lambda x: x[1],
-            reverse=True
+            key=lambda x: x[1]
         )
-        for error_type, count in sorted_errors[:10]:
+        for error_type, count in top_errors:
             print(f"  - {error_type}: {count}")
 
     print("=" * 60 + "\n")
@@ -81,13 +90,13 @@ def cmd_validate(args):
     invoices = load_invoices_from_json(args.input)
 
     print(f"Validating {len(invoices)} invoices...")
-    summary = validate_invoices(invoices)
+    # Per-invoice results are only needed for the report
+    summary = validate_invoices(invoices, return_results=bool(args.report))
 
     print_summary(summary)
 
     if args.report:
-        with open(args.report, "w") as f:
-            json.dump(summary, f, indent=2)
+        write_json(summary, args.report)
         print(f"Report saved to {args.report}")
 
     # Exit with error if there are invalid invoices
@@ -110,13 +119,13 @@ def cmd_full_run(args):
 
     # Validate
     print("\n[2/2] Validating invoices...")
-    summary = validate_invoices(invoices)
+    # Per-invoice results are only needed for the report
+    summary = validate_invoices(invoices, return_results=bool(args.report))
 
     print_summary(summary)
 
     if args.report:
-        with open(args.report, "w") as f:
-            json.dump(summary, f, indent=2)
+        write_json(summary, args.report)
         print(f"Report saved to {args.report}")
 
     # Exit with error if there are invalid invoices
@@ -1,103 +1,602 @@
+import os
 import re
-import json
+import hashlib
+import mmap
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Set
 from datetime import datetime
 
+import msgspec
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
 try:
     import pdfplumber
 except ImportError:
     pdfplumber = None
 
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
 from invoice_qc.schema import Invoice, LineItem
 
 
-class InvoiceExtractor:
-    def __init__(self):
-        if not pdfplumber:
-            raise ImportError("pdfplumber is required. Install with: pip install pdfplumber")
+# Field patterns, compiled once at import and shared by the extraction
+# helpers and the Hyperscan prefilter
+_DATE_VALUE = r"(\d{1,2}[\.\/-]\d{1,2}[\.\/-]\d{4}|\d{4}[\.\/-]\d{1,2}[\.\/-]\d{1,2})"
+
+
+def _keyword_date_re(keyword: str) -> re.Pattern:
+    return re.compile(keyword + r"[\s:]*" + _DATE_VALUE, re.IGNORECASE)
+
+
+_TAX_ID_LABEL_RE = re.compile(
+    r"(?:tax id|vat|vat id|tax number|reg no)[\s:]*([A-Z]{2}\d{9,12}|\d{9,12})", re.IGNORECASE
+)
+
+
+def _keyword_tax_id_re(keyword: str) -> re.Pattern:
+    return re.compile(keyword + r"[\s\S]*?" + _TAX_ID_LABEL_RE.pattern, re.IGNORECASE)
+
+
+_INVOICE_NUM_RES = tuple(re.compile(p, re.IGNORECASE) for p in [
+    r"(?:invoice\s*(?:no|number|#|num)?[\s:]*([A-Z0-9\-\/]+))",
+    r"(?:invoice[^a-z0-9]*([A-Z0-9\-\/]+))",
+    r"(?:inv[\s:]?\s*([A-Z0-9\-\/]+))",
+])
+
+_INVOICE_DATE_RES = tuple(_keyword_date_re(k) for k in ["invoice date", "date:", "issued"])
+_DUE_DATE_RES = tuple(_keyword_date_re(k) for k in ["due date", "payment due", "due by"])
+_ANY_DATE_RE = re.compile(_DATE_VALUE)
+
+_SELLER_NAME_RES = tuple(re.compile(p, re.IGNORECASE | re.MULTILINE) for p in [
+    r"(?:from|seller|invoice from)[\s:]*([A-Za-z\s&\.]+?)(?:\n|address|tax)",
+    r"(?:^|\n)([A-Za-z][A-Za-z\s&\.]{5,40}?)(?:\n|address|tax|phone)",
+])
+_BUYER_NAME_RES = tuple(re.compile(p, re.IGNORECASE) for p in [
+    r"(?:to|buyer|bill to|invoice to)[\s:]*([A-Za-z\s&\.]+?)(?:\n|address|tax)",
+])
+
+_SELLER_TAX_ID_KEYWORDS = ["seller", "from", "bill from"]
+_BUYER_TAX_ID_KEYWORDS = ["buyer", "to", "bill to"]
+_SELLER_TAX_ID_RES = tuple(_keyword_tax_id_re(k) for k in _SELLER_TAX_ID_KEYWORDS)
+_BUYER_TAX_ID_RES = tuple(_keyword_tax_id_re(k) for k in _BUYER_TAX_ID_KEYWORDS)
+# Keyword alone for each tax ID pattern, see _extract_tax_id
+_TAX_ID_KEYWORD_RES = dict(zip(
+    _SELLER_TAX_ID_RES + _BUYER_TAX_ID_RES,
+    [re.compile(k, re.IGNORECASE) for k in _SELLER_TAX_ID_KEYWORDS + _BUYER_TAX_ID_KEYWORDS],
+))
+_VAT_ID_RE = re.compile(r"(?:vat id|tax id|reg\.?\s*no)[\s:]*([A-Z]{2}\d{9,12})", re.IGNORECASE)
+
+# Currency markers are case-sensitive literals, so they are looked up with
+# substring tests; the compiled patterns only feed the Hyperscan prefilter
+_CURRENCY_MARKERS = [
+    ("EUR", ("EUR", "€")),
+    ("USD", ("USD", "$")),
+    ("GBP", ("GBP", "£")),
+    ("INR", ("INR", "₹")),
+    ("CHF", ("CHF",)),
+    ("JPY", ("JPY", "¥")),
+]
+_CURRENCY_RES = {
+    code: re.compile("|".join(re.escape(marker) for marker in markers))
+    for code, markers in _CURRENCY_MARKERS
+}
+
+_AMOUNT_NET_RES = tuple(re.compile(p, re.IGNORECASE) for p in [
+    r"(?:subtotal|net|amount|total|net\s*total)[\s:]*[€$\£\₹]?\s*([0-9,\.]+)",
+    r"(?:^|\n)([0-9,\.]+)\s*(?:€|$|£|₹|EUR|USD)",
+])
+_AMOUNT_TAX_RES = tuple(re.compile(p, re.IGNORECASE) for p in [
+    r"(?:tax|vat|tva)[\s:]*[€$\£\₹]?\s*([0-9,\.]+)",
+])
+_AMOUNT_GROSS_RES = tuple(re.compile(p, re.IGNORECASE) for p in [
+    r"(?:total|amount due|grand total|gross)[\s:]*[€$\£\₹]?\s*([0-9,\.]+)",
+])
+_TAX_RATE_RE = re.compile(r"(?:tax rate|vat rate|rate)[\s:]*([0-9,\.]+)\s*%", re.IGNORECASE)
+
+# Labelled patterns and the fallbacks for unlabelled text (a bare name line,
+# a bare amount; also _ANY_DATE_RE and _VAT_ID_RE). Page by page, fallbacks
+# only apply once all pages are read, so a labelled value on a later page
+# wins as it does in the joined text.
+_INVOICE_NUM_KEYWORD_RES, _INVOICE_NUM_FALLBACK_RES = _INVOICE_NUM_RES[:2], _INVOICE_NUM_RES[2:]
+_SELLER_NAME_KEYWORD_RES, _SELLER_NAME_FALLBACK_RES = _SELLER_NAME_RES[:1], _SELLER_NAME_RES[1:]
+_AMOUNT_NET_KEYWORD_RES, _AMOUNT_NET_FALLBACK_RES = _AMOUNT_NET_RES[:1], _AMOUNT_NET_RES[1:]
+
+# Whitespace stripped from amounts before parsing
+_AMOUNT_TRANS = str.maketrans("", "", " \t\n\r\f\v\u00a0")
+
+# Simple pattern for line items
+# Looks for patterns like: "description quantity@price = total"
+_LINE_RE = re.compile(
+    r"^(.+?)\s+(\d+(?:[,\.]\d+)?)\s+(?:x|\*|@)?\s*([0-9,\.]+)\s*(?:€|\$|£|₹)?\s*=?\s*([0-9,\.]+)",
+    re.MULTILINE,
+)
+
+# Scalar fields parse_invoice_text_incremental fills; pages are read until all are known
+# from labelled matches
+_PARSED_FIELDS = (
+    "invoice_number", "invoice_date", "due_date",
+    "seller_name", "buyer_name", "seller_tax_id", "buyer_tax_id",
+    "currency", "net_total", "tax_amount", "gross_total", "tax_rate",
+)
+
+
+def _all_patterns() -> List[re.Pattern]:
+    """Every pattern the extraction helpers may search for."""
+    patterns = list(_INVOICE_NUM_RES + _INVOICE_DATE_RES + _DUE_DATE_RES)
+    patterns.append(_ANY_DATE_RE)
+    patterns += _SELLER_NAME_RES + _BUYER_NAME_RES
+    patterns += _SELLER_TAX_ID_RES + _BUYER_TAX_ID_RES
+    patterns.append(_VAT_ID_RE)
+    patterns += _CURRENCY_RES.values()
+    patterns += _AMOUNT_NET_RES + _AMOUNT_TAX_RES + _AMOUNT_GROSS_RES
+    patterns += [_TAX_RATE_RE, _LINE_RE]
+    return list(dict.fromkeys(patterns))
+
+
+def _hyperscan_expression(pattern: str) -> str:
+    """
+    Translate a `re` pattern into a Hyperscan expression that matches at least
+    as much.
+
+    Hyperscan does not accept escaped non-ASCII literals such as "\\€", and its
+    Unicode `\\s` leaves out the separators U+001C to U+001F, which `re`
+    treats as whitespace.
+    """
+    out = []
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\" and i + 1 < len(pattern):
+            escaped = pattern[i + 1]
+            if escaped == "s":
+                out.append(r"\s\x1c-\x1f" if in_class else r"[\s\x1c-\x1f]")
+            elif escaped > "\x7f":
+                out.append(escaped)
+            else:
+                out.append(char + escaped)
+            i += 2
+            continue
+        if char == "[" and not in_class:
+            in_class = True
+            # A "]" straight after "[" or "[^" is a literal
+            j = i + 1 + (pattern[i + 1:i + 2] == "^")
+            if pattern[j:j + 1] == "]":
+                j += 1
+            out.append(pattern[i:j])
+            i = j
+            continue
+        if char == "]" and in_class:
+            in_class = False
+        out.append(char)
+        i += 1
+    return "".join(out)
+
+
+def _build_prefilter_db():
+    """
+    Compile all field patterns into one Hyperscan database.
+
+    Hyperscan cannot report capture groups, so the database is only used to
+    find out which patterns can match at all; `re` still extracts the groups.
+    Patterns are compiled in prefilter mode with the most permissive flags, so
+    the reported set is a superset of the patterns `re` would match.
+    """
+    if not hyperscan:
+        return None
 
-    def extract_from_folder(self, pdf_dir: str) -> List[Invoice]:
+    patterns = _all_patterns()
+    flags = (
+        hyperscan.HS_FLAG_CASELESS
+        | hyperscan.HS_FLAG_MULTILINE
+        | hyperscan.HS_FLAG_DOTALL
+        | hyperscan.HS_FLAG_UTF8
+        | hyperscan.HS_FLAG_UCP
+        | hyperscan.HS_FLAG_PREFILTER
+        | hyperscan.HS_FLAG_SINGLEMATCH
+    )
+    expressions = [_hyperscan_expression(p.pattern).encode("utf-8") for p in patterns]
+
+    db = hyperscan.Database()
+    try:
+        db.compile(
+            expressions=expressions,
+            ids=list(range(len(patterns))),
+            elements=len(patterns),
+            flags=[flags] * len(patterns),
+        )
+    except hyperscan.error:
+        return None
+
+    return db, patterns
+
+
+# PDF text extraction backend: "pdfplumber" or "pdfium" (PDFium via
+# pypdfium2, much faster). The field patterns were written against
+# pdfplumber's text layout, which PDFium does not reproduce exactly, so
+# pdfplumber stays the default when it is installed.
+PDF_BACKEND = os.environ.get("INVOICE_QC_PDF_BACKEND") or ("pdfplumber" if pdfplumber else "pdfium")
+
+# Extracted invoices are cached on disk by the SHA-256 of the PDF bytes.
+# Bump _CACHE_VERSION whenever a change to the extraction alters its output.
+CACHE_DIR = Path(os.environ.get("INVOICE_QC_CACHE_DIR") or Path("~/.cache/invoice_qc").expanduser())
+CACHE_MAX_ENTRIES = 1000
+_CACHE_VERSION = 4
+
+
+def _sha256(pdf) -> str:
+    """SHA-256 of a PDF path or seekable binary stream."""
+    digest = hashlib.sha256()
+    if isinstance(pdf, (str, Path)):
+        # Hash the mapped file so the OS pages it in on demand instead of
+        # the contents being copied into bytes objects chunk by chunk
+        with open(pdf, "rb") as f:
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    digest.update(mm)
+    elif isinstance(pdf, BytesIO):
+        with pdf.getbuffer() as view:
+            digest.update(view[pdf.tell():])
+    else:
+        start = pdf.tell()
+        while chunk := pdf.read(1024 * 1024):
+            digest.update(chunk)
+        pdf.seek(start)
+    return digest.hexdigest()
+
+
+def _cache_path(key: str) -> Path:
+    return CACHE_DIR / f"v{_CACHE_VERSION}" / f"{key}.json"
+
+
+@lru_cache(maxsize=CACHE_MAX_ENTRIES)
+def _read_cache_entry(key: str) -> bytes:
+    # A miss raises, and lru_cache does not cache exceptions
+    return _cache_path(key).read_bytes()
+
+
+def _load_cached_invoice(key: str) -> Optional[Invoice]:
+    try:
+        data = _read_cache_entry(key)
+        os.utime(_cache_path(key))
+    except OSError:
+        return None
+    try:
+        return msgspec.json.decode(data, type=Invoice)
+    except msgspec.MsgspecError:
+        # A corrupt or incompatible entry is a miss; drop it so it is rewritten
+        _read_cache_entry.cache_clear()
+        _cache_path(key).unlink(missing_ok=True)
+        return None
+
+
+def _store_cached_invoice(key: str, invoice: Invoice) -> None:
+    path = _cache_path(key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(msgspec.json.encode(invoice))
+        os.replace(tmp_path, path)
+
+        # Evict the least recently used entries
+        entries = list(path.parent.glob("*.json"))
+        if len(entries) > CACHE_MAX_ENTRIES:
+            entries.sort(key=lambda entry: entry.stat().st_mtime)
+            for entry in entries[:len(entries) - CACHE_MAX_ENTRIES]:
+                entry.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+class InvoiceExtractor:
+    def __init__(self, use_cache: bool = True, pdf_backend: Optional[str] = None):
+        self.pdf_backend = pdf_backend or PDF_BACKEND
+        if self.pdf_backend == "pdfium":
+            if not pdfium:
+                raise ImportError("pypdfium2 is required. Install with: pip install pypdfium2")
+        elif self.pdf_backend == "pdfplumber":
+            if not pdfplumber:
+                raise ImportError("pdfplumber is required. Install with: pip install pdfplumber")
+        else:
+            raise ValueError(f"Unknown PDF backend: {self.pdf_backend}")
+        self.use_cache = use_cache
+        self._prefilter = _build_prefilter_db()
+        self._local = threading.local()
+
+    def extract_from_folder(self, pdf_dir: str, max_workers: Optional[int] = None) -> List[Invoice]:
         """Extract invoices from all PDFs in a directory."""
         pdf_path = Path(pdf_dir)
-        invoices = []
-
-        for pdf_file in sorted(pdf_path.glob("*.pdf")):
+        pdf_files = [str(pdf_file) for pdf_file in sorted(pdf_path.glob("*.pdf"))]
+        return self.extract_from_pdfs(pdf_files, max_workers)
+
+    def extract_from_pdfs(
+        self, pdfs: list, max_workers: Optional[int] = None, pool: Optional[Executor] = None
+    ) -> List[Invoice]:
+        """
+        Extract invoices from a list of PDF paths or in-memory PDF streams.
+
+        PDFs are parsed in a process pool (one worker per CPU unless
+        max_workers is given); results keep the order of pdfs. A pool from
+        create_worker_pool can be passed to reuse its workers across calls
+        instead of starting new ones. A PDF whose extraction fails, including
+        through its worker dying, is reported and skipped; if the pool is
+        already broken when the PDFs are submitted, BrokenProcessPool is
+        raised so the caller can replace it.
+        """
+        if pool is not None and len(pdfs) > 1:
+            return self._extract_in_pool(pool, pdfs)
+
+        workers = min(max_workers or os.cpu_count() or 1, len(pdfs))
+
+        if workers <= 1:
+            results = []
+            for pdf in pdfs:
+                try:
+                    results.append(self.extract_from_pdf(pdf))
+                except Exception as e:
+                    print(f"Error extracting {_pdf_name(pdf)}: {e}")
+            return [inv for inv in results if inv]
+
+        with self.create_worker_pool(workers) as pool:
+            return self._extract_in_pool(pool, pdfs)
+
+    def create_worker_pool(self, max_workers: Optional[int] = None, mp_context=None) -> ProcessPoolExecutor:
+        """
+        Process pool whose workers each hold an extractor configured like
+        this one, for extract_from_pdfs. The caller shuts it down.
+        """
+        return ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(type(self), self.use_cache, self.pdf_backend),
+        )
+
+    def _extract_in_pool(self, pool: Executor, pdfs: list) -> List[Invoice]:
+        results = [None] * len(pdfs)
+        futures = {
+            pool.submit(_extract_pdf_worker, pdf): i
+            for i, pdf in enumerate(pdfs)
+        }
+        for future in as_completed(futures):
+            i = futures[future]
             try:
-                invoice = self.extract_from_pdf(str(pdf_file))
-                if invoice:
-                    invoices.append(invoice)
+                results[i] = future.result()
             except Exception as e:
-                print(f"Error extracting {pdf_file.name}: {e}")
+                print(f"Error extracting {_pdf_name(pdfs[i])}: {e}")
+
+        return [inv for inv in results if inv]
+
+    def extract_from_pdf(self, pdf_path) -> Optional[Invoice]:
+        """
+        Extract a single invoice from a PDF path or binary stream.
+
+        A PDF whose contents were extracted before is served from the cache.
+        """
+        if not self.use_cache:
+            return self._parse_pdf(pdf_path)
+
+        # Backends lay text out differently, so each gets its own entries
+        key = f"{self.pdf_backend}/{_sha256(pdf_path)}"
+        invoice = _load_cached_invoice(key)
+        if invoice is None:
+            invoice = self._parse_pdf(pdf_path)
+            _store_cached_invoice(key, invoice)
+
+        return invoice
+
+    def _parse_pdf(self, pdf_path) -> Invoice:
+        """
+        Parse a PDF into an invoice.
 
-        return invoices
+        Pages are read one at a time. The remaining pages are not loaded once
+        every field the parser fills is known from a labelled match and the
+        last page added no line items, since line item tables may continue
+        onto the next page. Fallback matches are applied at the end.
+        """
+        invoice = Invoice()
+        fallbacks = {}
+
+        for page_text in self._iter_page_texts(pdf_path):
+            item_count = len(invoice.line_items)
+            self.parse_invoice_text_incremental(invoice, page_text, fallbacks)
+            if len(invoice.line_items) == item_count and self._has_all_fields(invoice):
+                break
 
-    def extract_from_pdf(self, pdf_path: str) -> Optional[Invoice]:
-        """Extract a single invoice from a PDF."""
-        with pdfplumber.open(pdf_path) as pdf:
-            text = "\n".join(page.extract_text() or "" for page in pdf.pages)
+        for name, value in fallbacks.items():
+            if getattr(invoice, name) is None:
+                setattr(invoice, name, value)
 
-        return self.parse_invoice_text(text)
+        return invoice
+
+    def _iter_page_texts(self, pdf_path):
+        """
+        Yield the text of each page, loading pages lazily.
+
+        Every page but the last ends with a newline, so the pages concatenate
+        to the text of the whole document and patterns anchored on line ends
+        match at the end of a page too.
+        """
+        if self.pdf_backend == "pdfplumber":
+            with pdfplumber.open(pdf_path) as pdf:
+                last = len(pdf.pages) - 1
+                for i, page in enumerate(pdf.pages):
+                    text = page.extract_text() or ""
+                    yield text + "\n" if i < last else text
+            return
+
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            last = len(pdf) - 1
+            for i, page in enumerate(pdf):
+                textpage = page.get_textpage()
+                # PDFium separates lines with CRLF
+                text = textpage.get_text_range().replace("\r\n", "\n")
+                textpage.close()
+                page.close()
+                yield text + "\n" if i < last else text
+        finally:
+            pdf.close()
 
     def parse_invoice_text(self, text: str) -> Optional[Invoice]:
         """Parse invoice text into structured data."""
         invoice = Invoice()
+        self.parse_invoice_text_incremental(invoice, text)
+        return invoice
+
+    def parse_invoice_text_incremental(
+        self, invoice: Invoice, text: str, fallbacks: Optional[dict] = None
+    ) -> Invoice:
+        """
+        Fill the fields of invoice that are still None from text.
+
+        Line items are appended, so a multi-page invoice can be parsed one
+        page at a time. Pass the same fallbacks dict for every page: values
+        only found by a fallback pattern are then kept there (the first
+        page's winning) instead of being set, for the caller to apply once
+        no page is left that could have a labelled value.
+        """
+        # Find which patterns can match in a single pass over the text
+        hits = self._scan(text)
+        fallback = fallbacks is None
 
         # Extract invoice number
-        invoice.invoice_number = self._extract_invoice_number(text)
+        if invoice.invoice_number is None:
+            invoice.invoice_number = self._extract_invoice_number(
+                text, hits, _INVOICE_NUM_RES if fallback else _INVOICE_NUM_KEYWORD_RES
+            )
 
         # Extract dates
-        invoice.invoice_date = self._extract_date(text, ["invoice date", "date:", "issued"])
-        invoice.due_date = self._extract_date(text, ["due date", "payment due", "due by"])
+        if invoice.invoice_date is None:
+            invoice.invoice_date = self._extract_date(text, _INVOICE_DATE_RES, hits, fallback)
+        if invoice.due_date is None:
+            invoice.due_date = self._extract_date(text, _DUE_DATE_RES, hits, fallback)
 
         # Extract party information
-        invoice.seller_name = self._extract_seller_name(text)
-        invoice.buyer_name = self._extract_buyer_name(text)
-        invoice.seller_tax_id = self._extract_tax_id(text, ["seller", "from", "bill from"])
-        invoice.buyer_tax_id = self._extract_tax_id(text, ["buyer", "to", "bill to"])
+        if invoice.seller_name is None:
+            invoice.seller_name = self._extract_seller_name(
+                text, hits, _SELLER_NAME_RES if fallback else _SELLER_NAME_KEYWORD_RES
+            )
+        if invoice.buyer_name is None:
+            invoice.buyer_name = self._extract_buyer_name(text, hits)
+        if invoice.seller_tax_id is None:
+            invoice.seller_tax_id = self._extract_tax_id(text, _SELLER_TAX_ID_RES, hits, fallback)
+        if invoice.buyer_tax_id is None:
+            invoice.buyer_tax_id = self._extract_tax_id(text, _BUYER_TAX_ID_RES, hits, fallback)
 
         # Extract currency
-        invoice.currency = self._extract_currency(text)
+        if invoice.currency is None:
+            invoice.currency = self._extract_currency(text, hits)
 
         # Extract amounts
-        amounts = self._extract_amounts(text)
-        invoice.net_total = amounts.get("net_total")
-        invoice.tax_amount = amounts.get("tax_amount")
-        invoice.gross_total = amounts.get("gross_total")
-        invoice.tax_rate = amounts.get("tax_rate")
+        amount_fields = ("net_total", "tax_amount", "gross_total", "tax_rate")
+        if any(getattr(invoice, name) is None for name in amount_fields):
+            amounts = self._extract_amounts(
+                text, hits, _AMOUNT_NET_RES if fallback else _AMOUNT_NET_KEYWORD_RES
+            )
+            for name in amount_fields:
+                if getattr(invoice, name) is None:
+                    setattr(invoice, name, amounts.get(name))
 
         # Extract line items
-        invoice.line_items = self._extract_line_items(text)
+        invoice.line_items.extend(self._extract_line_items(text, hits))
+
+        if not fallback:
+            self._collect_fallbacks(invoice, text, hits, fallbacks)
 
         return invoice
 
-    def _extract_invoice_number(self, text: str) -> Optional[str]:
+    def _collect_fallbacks(self, invoice: Invoice, text: str, hits: Optional[Set[re.Pattern]], fallbacks: dict) -> None:
+        """Add the fallback-pattern values of fields still missing to fallbacks."""
+        extractors = (
+            ("invoice_number", lambda: self._extract_invoice_number(text, hits, _INVOICE_NUM_FALLBACK_RES)),
+            ("invoice_date", lambda: self._extract_date(text, (), hits)),
+            ("due_date", lambda: self._extract_date(text, (), hits)),
+            ("seller_name", lambda: self._extract_seller_name(text, hits, _SELLER_NAME_FALLBACK_RES)),
+            ("seller_tax_id", lambda: self._extract_tax_id(text, (), hits)),
+            ("buyer_tax_id", lambda: self._extract_tax_id(text, (), hits)),
+            ("net_total", lambda: self._extract_net_total(text, hits, _AMOUNT_NET_FALLBACK_RES)),
+        )
+        for name, extract in extractors:
+            if getattr(invoice, name) is None and name not in fallbacks:
+                value = extract()
+                if value is not None:
+                    fallbacks[name] = value
+
+    def _has_all_fields(self, invoice: Invoice) -> bool:
+        """True once every field parse_invoice_text_incremental fills is known."""
+        return all(getattr(invoice, name) is not None for name in _PARSED_FIELDS)
+
+    def _scan(self, text: str) -> Optional[Set[re.Pattern]]:
+        """
+        Return the patterns that may match in text, or None if unknown.
+
+        None means no prefilter is available and every pattern must be tried.
+        """
+        if not self._prefilter:
+            return None
+
+        db, patterns = self._prefilter
+        scratch = getattr(self._local, "scratch", None)
+        if scratch is None:
+            scratch = self._local.scratch = hyperscan.Scratch(db)
+
+        matched = set()
+        try:
+            db.scan(
+                text.encode("utf-8"),
+                match_event_handler=lambda id, from_, to, flags, ctx: ctx.add(id),
+                context=matched,
+                scratch=scratch,
+            )
+        except (UnicodeEncodeError, hyperscan.error):
+            return None
+
+        return {patterns[i] for i in matched}
+
+    def _search(self, regex: re.Pattern, text: str, hits: Optional[Set[re.Pattern]]):
+        """Search with a compiled pattern, skipping ones the prefilter ruled out."""
+        if hits is not None and regex not in hits:
+            return None
+        return regex.search(text)
+
+    def _extract_invoice_number(
+        self, text: str, hits: Optional[Set[re.Pattern]] = None, regexes: tuple = _INVOICE_NUM_RES
+    ) -> Optional[str]:
         """Extract invoice number from text."""
-        patterns = [
-            r"(?:invoice\s*(?:no|number|#|num)?[\s:]*([A-Z0-9\-\/]+))",
-            r"(?:invoice[^a-z0-9]*([A-Z0-9\-\/]+))",
-            r"(?:inv[\s:]?\s*([A-Z0-9\-\/]+))",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for regex in regexes:
+            match = self._search(regex, text, hits)
             if match:
                 return match.group(1).strip()
 
         return None
 
-    def _extract_date(self, text: str, keywords: List[str]) -> Optional[str]:
+    def _extract_date(
+        self, text: str, keyword_res: tuple, hits: Optional[Set[re.Pattern]] = None, fallback: bool = True
+    ) -> Optional[str]:
         """Extract date by looking for keywords."""
-        for keyword in keywords:
-            pattern = rf"{keyword}[\s:]*(\d{{1,2}}[\.\/-]\d{{1,2}}[\.\/-]\d{{4}}|\d{{4}}[\.\/-]\d{{1,2}}[\.\/-]\d{{1,2}})"
-            match = re.search(pattern, text, re.IGNORECASE)
+        for regex in keyword_res:
+            match = self._search(regex, text, hits)
             if match:
                 date_str = match.group(1)
                 return self._normalize_date(date_str)
 
+        if not fallback:
+            return None
+
         # Try to find any date pattern
-        date_pattern = r"(\d{1,2}[\.\/-]\d{1,2}[\.\/-]\d{4}|\d{4}[\.\/-]\d{1,2}[\.\/-]\d{1,2})"
-        match = re.search(date_pattern, text)
+        match = self._search(_ANY_DATE_RE, text, hits)
         if match:
             return self._normalize_date(match.group(1))
 
@@ -117,15 +616,12 @@ class InvoiceExtractor:
             pass
         return date_str
 
-    def _extract_seller_name(self, text: str) -> Optional[str]:
+    def _extract_seller_name(
+        self, text: str, hits: Optional[Set[re.Pattern]] = None, regexes: tuple = _SELLER_NAME_RES
+    ) -> Optional[str]:
         """Extract seller name."""
-        patterns = [
-            r"(?:from|seller|invoice from)[\s:]*([A-Za-z\s&\.]+?)(?:\n|address|tax)",
-            r"(?:^|\n)([A-Za-z][A-Za-z\s&\.]{5,40}?)(?:\n|address|tax|phone)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+        for regex in regexes:
+            match = self._search(regex, text, hits)
             if match:
                 name = match.group(1).strip()
                 if len(name) > 3 and len(name) < 100:
@@ -133,14 +629,10 @@ class InvoiceExtractor:
 
         return None
 
-    def _extract_buyer_name(self, text: str) -> Optional[str]:
+    def _extract_buyer_name(self, text: str, hits: Optional[Set[re.Pattern]] = None) -> Optional[str]:
         """Extract buyer name."""
-        patterns = [
-            r"(?:to|buyer|bill to|invoice to)[\s:]*([A-Za-z\s&\.]+?)(?:\n|address|tax)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for regex in _BUYER_NAME_RES:
+            match = self._search(regex, text, hits)
             if match:
                 name = match.group(1).strip()
                 if len(name) > 3 and len(name) < 100:
@@ -148,40 +640,47 @@ class InvoiceExtractor:
 
         return None
 
-    def _extract_tax_id(self, text: str, keywords: List[str]) -> Optional[str]:
+    def _extract_tax_id(
+        self, text: str, keyword_res: tuple, hits: Optional[Set[re.Pattern]] = None, fallback: bool = True
+    ) -> Optional[str]:
         """Extract tax ID (VAT ID)."""
-        for keyword in keywords:
-            pattern = rf"{keyword}[\s\S]*?(?:tax id|vat|vat id|tax number|reg no)[\s:]*([A-Z]{2}\d{{9,12}}|\d{{9,12}})"
-            match = re.search(pattern, text, re.IGNORECASE)
+        for regex in keyword_res:
+            # "<keyword>[\s\S]*?<label>" retries the lazy gap from every keyword
+            # occurrence when no label follows, rescanning the rest of the text
+            # each time. Searching for the label after the first keyword finds
+            # the same match in a single pass.
+            if hits is not None and regex not in hits:
+                continue
+            keyword = _TAX_ID_KEYWORD_RES[regex].search(text)
+            if not keyword:
+                continue
+            match = _TAX_ID_LABEL_RE.search(text, keyword.end())
             if match:
                 return match.group(1).strip()
 
+        if not fallback:
+            return None
+
         # Generic VAT pattern
-        vat_pattern = r"(?:vat id|tax id|reg\.?\s*no)[\s:]*([A-Z]{2}\d{9,12})"
-        match = re.search(vat_pattern, text, re.IGNORECASE)
+        match = self._search(_VAT_ID_RE, text, hits)
         if match:
             return match.group(1)
 
         return None
 
-    def _extract_currency(self, text: str) -> Optional[str]:
+    def _extract_currency(self, text: str, hits: Optional[Set[re.Pattern]] = None) -> Optional[str]:
         """Extract currency."""
-        currencies = {
-            "EUR": r"EUR|\€",
-            "USD": r"USD|\$",
-            "GBP": r"GBP|\£",
-            "INR": r"INR|\₹",
-            "CHF": r"CHF",
-            "JPY": r"JPY|¥",
-        }
-
-        for currency, pattern in currencies.items():
-            if re.search(pattern, text):
+        for currency, markers in _CURRENCY_MARKERS:
+            if hits is not None and _CURRENCY_RES[currency] not in hits:
+                continue
+            if any(marker in text for marker in markers):
                 return currency
 
         return None
 
-    def _extract_amounts(self, text: str) -> dict:
+    def _extract_amounts(
+        self, text: str, hits: Optional[Set[re.Pattern]] = None, net_res: tuple = _AMOUNT_NET_RES
+    ) -> dict:
         """Extract monetary amounts."""
         amounts = {
             "net_total": None,
@@ -190,31 +689,12 @@ class InvoiceExtractor:
             "tax_rate": None,
         }
 
-        # Pattern to find amounts: handles both comma and dot as decimal separator
-        amount_pattern = r"([\d\.,]+)"
-
         # Extract net total
-        net_patterns = [
-            r"(?:subtotal|net|amount|total|net\s*total)[\s:]*[€$\£\₹]?\s*([0-9,\.]+)",
-            r"(?:^|\n)([0-9,\.]+)\s*(?:€|$|£|₹|EUR|USD)",
-        ]
-
-        for pattern in net_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                try:
-                    amounts["net_total"] = self._parse_amount(match.group(1))
-                    break
-                except:
-                    continue
+        amounts["net_total"] = self._extract_net_total(text, hits, net_res)
 
         # Extract tax amount
-        tax_patterns = [
-            r"(?:tax|vat|tva)[\s:]*[€$\£\₹]?\s*([0-9,\.]+)",
-        ]
-
-        for pattern in tax_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for regex in _AMOUNT_TAX_RES:
+            match = self._search(regex, text, hits)
             if match:
                 try:
                     amounts["tax_amount"] = self._parse_amount(match.group(1))
@@ -223,12 +703,8 @@ class InvoiceExtractor:
                     continue
 
         # Extract gross total
-        gross_patterns = [
-            r"(?:total|amount due|grand total|gross)[\s:]*[€$\£\₹]?\s*([0-9,\.]+)",
-        ]
-
-        for pattern in gross_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for regex in _AMOUNT_GROSS_RES:
+            match = self._search(regex, text, hits)
             if match:
                 try:
                     amounts["gross_total"] = self._parse_amount(match.group(1))
@@ -237,8 +713,7 @@ class InvoiceExtractor:
                     continue
 
         # Extract tax rate
-        tax_rate_pattern = r"(?:tax rate|vat rate|rate)[\s:]*([0-9,\.]+)\s*%"
-        match = re.search(tax_rate_pattern, text, re.IGNORECASE)
+        match = self._search(_TAX_RATE_RE, text, hits)
         if match:
             try:
                 amounts["tax_rate"] = float(match.group(1).replace(",", "."))
@@ -247,60 +722,103 @@ class InvoiceExtractor:
 
         return amounts
 
+    def _extract_net_total(
+        self, text: str, hits: Optional[Set[re.Pattern]] = None, regexes: tuple = _AMOUNT_NET_RES
+    ) -> Optional[float]:
+        """Extract the net total."""
+        for regex in regexes:
+            match = self._search(regex, text, hits)
+            if match:
+                try:
+                    return self._parse_amount(match.group(1))
+                except:
+                    continue
+
+        return None
+
     def _parse_amount(self, amount_str: str) -> float:
         """Parse amount string to float."""
-        # Remove spaces and determine decimal separator
-        amount_str = amount_str.strip()
-
-        # If it has both comma and dot, use the last one as decimal separator
-        if "," in amount_str and "." in amount_str:
-            if amount_str.rfind(",") > amount_str.rfind("."):
-                amount_str = amount_str.replace(".", "").replace(",", ".")
-            else:
-                amount_str = amount_str.replace(",", "")
-        elif "," in amount_str:
-            # If only comma, check if it's thousands separator or decimal
-            comma_pos = amount_str.rfind(",")
-            if comma_pos > 0 and len(amount_str) - comma_pos == 3:
-                # Likely decimal separator
-                amount_str = amount_str.replace(",", ".")
-            else:
-                # Likely thousands separator
-                amount_str = amount_str.replace(",", "")
+        # Remove spaces (including non-breaking ones) in a single C-level pass.
+        # Matched amounts never contain any, and the translate is the costliest
+        # step here, so only run it when a space or unprintable char is present.
+        if " " in amount_str or not amount_str.isprintable():
+            amount_str = amount_str.translate(_AMOUNT_TRANS)
+
+        # The comma is the decimal separator if it comes after the last dot,
+        # or if it is the only separator and is followed by exactly 2 digits.
+        # Otherwise commas are thousands separators.
+        comma_pos = amount_str.rfind(",")
+        dot_pos = amount_str.rfind(".")
+        if comma_pos > dot_pos and (dot_pos >= 0 or (comma_pos > 0 and len(amount_str) - comma_pos == 3)):
+            amount_str = amount_str.replace(".", "").replace(",", ".")
+        elif comma_pos >= 0:
+            amount_str = amount_str.replace(",", "")
 
         return float(amount_str)
 
-    def _extract_line_items(self, text: str) -> List[LineItem]:
+    def _extract_line_items(self, text: str, hits: Optional[Set[re.Pattern]] = None) -> List[LineItem]:
         """Extract line items from invoice text."""
         items = []
 
-        # Simple pattern for line items
-        # Looks for patterns like: "description quantity@price = total"
-        line_pattern = r"^(.+?)\s+(\d+(?:[,\.]\d+)?)\s+(?:x|\*|@)?\s*([0-9,\.]+)\s*(?:€|\$|£|₹)?\s*=?\s*([0-9,\.]+)"
+        if hits is not None and _LINE_RE not in hits:
+            return items
 
-        matches = re.finditer(line_pattern, text, re.MULTILINE)
-        for match in matches:
+        # findall hands back plain group tuples, so no match object is built
+        # per row; rows whose numbers do not parse are dropped
+        parse_amount = self._parse_amount
+        for description, quantity, unit_price, line_total in _LINE_RE.findall(text):
             try:
-                item = LineItem(
-                    description=match.group(1).strip(),
-                    quantity=float(match.group(2).replace(",", ".")),
-                    unit_price=self._parse_amount(match.group(3)),
-                    line_total=self._parse_amount(match.group(4)),
-                )
-                items.append(item)
-            except:
+                items.append(LineItem(
+                    description=description.strip(),
+                    quantity=float(quantity.replace(",", ".")),
+                    unit_price=parse_amount(unit_price),
+                    line_total=parse_amount(line_total),
+                ))
+            except ValueError:
                 continue
 
         return items
 
 
+# Extractor owned by each process-pool worker, see extract_from_folder
+_worker_extractor: Optional[InvoiceExtractor] = None
+
+
+def _init_worker(extractor_cls: type, use_cache: bool, pdf_backend: str) -> None:
+    global _worker_extractor
+    _worker_extractor = extractor_cls(use_cache=use_cache, pdf_backend=pdf_backend)
+
+
+def _extract_pdf_worker(pdf_path) -> Optional[Invoice]:
+    return _worker_extractor.extract_from_pdf(pdf_path)
+
+
+def _pdf_name(pdf) -> str:
+    """File name of a PDF path or named stream, for error messages."""
+    if isinstance(pdf, (str, Path)):
+        return Path(pdf).name
+    return getattr(pdf, "name", "<stream>")
+
+
+# Extractor shared by extract_invoices and the API. Built on first use, so
+# importing this module does not require a PDF backend.
+_EXTRACTOR: Optional[InvoiceExtractor] = None
+
+
+def get_extractor() -> InvoiceExtractor:
+    """Return the shared InvoiceExtractor, creating it on first call."""
+    global _EXTRACTOR
+    if _EXTRACTOR is None:
+        _EXTRACTOR = InvoiceExtractor()
+    return _EXTRACTOR
+
+
 def extract_invoices(pdf_dir: str) -> List[Invoice]:
     """Convenience function to extract invoices from a directory."""
-    extractor = InvoiceExtractor()
-    return extractor.extract_from_folder(pdf_dir)
+    return get_extractor().extract_from_folder(pdf_dir)
 
 
 def extract_to_json(pdf_dir: str) -> str:
     """Extract invoices and return as JSON."""
     invoices = extract_invoices(pdf_dir)
-    return json.dumps([inv.to_dict() for inv in invoices], indent=2)
+    return msgspec.json.format(msgspec.json.encode(invoices), indent=2).decode("utf-8")
@@ -2,8 +2,10 @@ from dataclasses import dataclass, field
 from typing import Optional, List
 from datetime import date
 
+import msgspec
 
-@dataclass
+
+@dataclass(slots=True)
 class LineItem:
     description: Optional[str] = None
     quantity: Optional[float] = None
@@ -11,7 +13,7 @@ class LineItem:
     line_total: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Invoice:
     # Identifiers
     invoice_number: Optional[str] = None
@@ -41,29 +43,4 @@ class Invoice:
     line_items: List[LineItem] = field(default_factory=list)
 
     def to_dict(self):
-        return {
-            "invoice_number": self.invoice_number,
-            "external_reference": self.external_reference,
-            "invoice_date": self.invoice_date,
-            "due_date": self.due_date,
-            "seller_name": self.seller_name,
-            "seller_address": self.seller_address,
-            "seller_tax_id": self.seller_tax_id,
-            "buyer_name": self.buyer_name,
-            "buyer_address": self.buyer_address,
-            "buyer_tax_id": self.buyer_tax_id,
-            "currency": self.currency,
-            "net_total": self.net_total,
-            "tax_amount": self.tax_amount,
-            "gross_total": self.gross_total,
-            "tax_rate": self.tax_rate,
-            "line_items": [
-                {
-                    "description": item.description,
-                    "quantity": item.quantity,
-                    "unit_price": item.unit_price,
-                    "line_total": item.line_total,
-                }
-                for item in self.line_items
-            ],
-        }
+        return msgspec.to_builtins(self)
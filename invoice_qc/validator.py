@@ -1,25 +1,242 @@
+import math
+import os
 import re
-from datetime import datetime
-from typing import List, Dict, Any, Optional
-from collections import defaultdict
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import date, datetime
+from functools import partial
+from itertools import chain, repeat
+from typing import List, Dict, Any, Optional, Tuple
+from collections import Counter
+from operator import attrgetter, itemgetter
 
 from invoice_qc.schema import Invoice
 
 
+# Simple VAT ID format: 2 letters + 9-12 digits. \Z rather than $, which
+# would also accept a trailing newline.
+_VAT_RE = re.compile(r"^[A-Z]{2}\d{9,12}\Z")
+
+DATE_FIELDS = ("invoice_date", "due_date")
+
+# Parsed value of a date field that is set but not a valid YYYY-MM-DD date
+INVALID_DATE = object()
+
+
+def parse_date_field(invoice: Invoice, field_name: str):
+    """
+    Parse a date field of an invoice.
+
+    Returns None if the field is empty, INVALID_DATE if it cannot be parsed,
+    otherwise the parsed date.
+    """
+    return _parse_date(getattr(invoice, field_name, None))
+
+
+def _parse_date(value):
+    """parse_date_field for the field's value."""
+    if not value:
+        return None
+
+    # date.fromisoformat is much faster than strptime, but also accepts
+    # other ISO 8601 forms, so it is only used for the canonical YYYY-MM-DD
+    # shape; everything else, including its failures, goes through strptime
+    if len(value) == 10 and value[4] == "-" and value[7] == "-" and value.isascii():
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            pass
+
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        return INVALID_DATE
+
+
+def _get_date(invoice: Invoice, field_name: str, context: Optional[Dict[str, Any]]):
+    """Parsed date field, taken from the validation context when available."""
+    if context is not None and field_name in context["dates"]:
+        return context["dates"][field_name]
+    return parse_date_field(invoice, field_name)
+
+
+# Checks behind the rules, taking the field values directly. They are shared
+# by the rule classes and InvoiceValidator._fast_validate. Per-field checks
+# take their error messages ready-made, so nothing is formatted per invoice.
+
+def _missing_field_error(value, error: str) -> Optional[str]:
+    if not value or (isinstance(value, str) and not value.strip()):
+        return error
+    return None
+
+
+def _date_error(dt, now_year: int, format_error: str, range_error: str) -> Optional[str]:
+    if dt is None:
+        return None
+    if dt is INVALID_DATE:
+        return format_error
+
+    # Check if date is within reasonable range (past 50 years, future 10 years)
+    if dt.year < now_year - 50 or dt.year > now_year + 10:
+        return range_error
+
+    return None
+
+
+def _currency_error(currency, allowed_currencies) -> Optional[str]:
+    if not currency:
+        return None
+
+    # Most currencies are already upper case; only upper() the rest
+    if currency not in allowed_currencies and currency.upper() not in allowed_currencies:
+        return f"invalid_currency: {currency}"
+
+    return None
+
+
+def _negative_amount_error(value, error: str) -> Optional[str]:
+    if value is not None and value < 0:
+        return error
+    return None
+
+
+def _totals_error(net_total, tax_amount, gross_total) -> Optional[str]:
+    if net_total is not None and tax_amount is not None and gross_total is not None:
+        # Compare in integer cents: rounding to an integer is much cheaper
+        # than round(x, 2), and the tolerance is then exactly one cent
+        # rather than 0.01 plus float noise
+        try:
+            mismatch = abs(round((net_total + tax_amount) * 100) - round(gross_total * 100)) > 1
+        except (ValueError, OverflowError):
+            # NaN or infinite amounts have no cents; compare them as floats
+            mismatch = abs(round(net_total + tax_amount, 2) - round(gross_total, 2)) > 0.01
+
+        if mismatch:
+            expected_gross = round(net_total + tax_amount, 2)
+            actual_gross = round(gross_total, 2)
+            return (f"business_rule_failed: totals_mismatch "
+                   f"(expected {expected_gross}, got {actual_gross})")
+
+    return None
+
+
+def _due_date_error(inv_date, due_date) -> Optional[str]:
+    # Missing or unparseable dates are reported by the other rules
+    if inv_date in (None, INVALID_DATE) or due_date in (None, INVALID_DATE):
+        return None
+
+    if due_date < inv_date:
+        return "business_rule_failed: due_date_before_invoice_date"
+
+    return None
+
+
+def _line_items_error(line_items, net_total) -> Optional[str]:
+    if line_items and net_total is not None:
+        totals = [item.line_total for item in line_items if item.line_total is not None]
+
+        if not totals:
+            return None
+
+        # Float totals are added with fsum, which is exact, so many items do
+        # not accumulate rounding error towards the tolerance. Integer sums
+        # are exact already and keep their formatting in the message.
+        if all(type(total) is int for total in totals):
+            items_sum = sum(totals)
+        else:
+            try:
+                items_sum = math.fsum(totals)
+            except (ValueError, OverflowError):
+                # inf - inf, or an intermediate overflow
+                items_sum = sum(totals)
+
+        if abs(items_sum - net_total) > 0.01:
+            return (f"business_rule_failed: line_items_sum_mismatch "
+                   f"(items sum {items_sum}, net total {net_total})")
+
+    return None
+
+
+def _parties_error(seller_name, buyer_name) -> Optional[str]:
+    if not (seller_name and buyer_name):
+        return None
+
+    # Identical names need no normalizing. casefold() rather than lower() so
+    # that e.g. "Straße" and "STRASSE" also count as the same name.
+    if (seller_name == buyer_name or
+        seller_name.strip().casefold() == buyer_name.strip().casefold()):
+        return "business_rule_failed: seller_and_buyer_same"
+
+    return None
+
+
 class ValidationRule:
-    """Base class for validation rules."""
+    """
+    Base class for validation rules.
 
-    def __init__(self, name: str, description: str):
+    requires lists the names of rules that must have passed for this rule to
+    run; InvoiceValidator skips it when any of them reported an error.
+
+    Rules are called as validate(invoice). Rules that set uses_context are
+    called as validate(invoice, context) instead, to share values such as
+    the parsed dates with the other rules.
+    """
+
+    uses_context = False
+
+    def __init__(self, name: str, description: str, requires: Tuple[str, ...] = ()):
         self.name = name
         self.description = description
+        self.requires = frozenset(requires)
 
-    def validate(self, invoice: Invoice) -> Optional[str]:
+    def validate(self, invoice: Invoice, context: Optional[Dict[str, Any]] = None) -> Optional[str]:
         """
         Validate an invoice.
         Returns None if valid, otherwise returns error message.
+
+        context, passed only when uses_context is set, holds values shared
+        by all rules for this invoice, such as the parsed dates (see
+        InvoiceValidator._apply_rules).
         """
         raise NotImplementedError
 
+    def apply(self, columns: Dict[str, Any], skip: Optional[List[bool]] = None) -> List[Optional[str]]:
+        """
+        Validate a whole batch, one error or None per invoice.
+
+        columns is a column store of the batch (see _extract_columns), so
+        rules can run over the field values instead of one invoice at a
+        time. Rows where skip is true had a prerequisite fail; their
+        result is discarded, so only rules with side effects need to
+        avoid checking them. This default calls validate per invoice.
+        """
+        if skip is None:
+            skip = repeat(False)
+
+        if not self.uses_context:
+            return [
+                None if skipped else self.validate(invoice)
+                for invoice, skipped in zip(columns["invoices"], skip)
+            ]
+
+        now_year = columns["now_year"]
+        date_columns = [_date_column(columns, field_name) for field_name in DATE_FIELDS]
+        errors = []
+        for invoice, skipped, dates in zip(columns["invoices"], skip, zip(*date_columns)):
+            if skipped:
+                errors.append(None)
+                continue
+            context = {"dates": dict(zip(DATE_FIELDS, dates)), "now_year": now_year}
+            errors.append(self.validate(invoice, context))
+        return errors
+
+
+def _run_rule(rule: ValidationRule, invoice: Invoice, context: Dict[str, Any]) -> Optional[str]:
+    """rule.validate, passing context only to rules that take it."""
+    if rule.uses_context:
+        return rule.validate(invoice, context)
+    return rule.validate(invoice)
+
 
 class CompletenessRule(ValidationRule):
     """Validates that required fields are present."""
@@ -30,60 +247,48 @@ class CompletenessRule(ValidationRule):
             f"Invoice must have non-empty {field_name}"
         )
         self.field_name = field_name
+        self._error = f"missing_field: {field_name}"
 
-    def validate(self, invoice: Invoice) -> Optional[str]:
-        value = getattr(invoice, self.field_name, None)
-        if not value or (isinstance(value, str) and not value.strip()):
-            return f"missing_field: {self.field_name}"
-        return None
+    def validate(self, invoice: Invoice, context: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        return _missing_field_error(getattr(invoice, self.field_name, None), self._error)
 
 
 class DateFormatRule(ValidationRule):
     """Validates date format and range."""
 
-    def __init__(self, field_name: str):
+    uses_context = True
+
+    def __init__(self, field_name: str, requires: Tuple[str, ...] = ()):
         super().__init__(
             f"date_format: {field_name}",
-            f"{field_name} must be in valid date format (YYYY-MM-DD)"
+            f"{field_name} must be in valid date format (YYYY-MM-DD)",
+            requires,
         )
         self.field_name = field_name
+        self._format_error = f"invalid_date_format: {field_name}"
+        self._range_error = f"date_out_of_range: {field_name}"
 
-    def validate(self, invoice: Invoice) -> Optional[str]:
-        value = getattr(invoice, self.field_name, None)
-        if not value:
-            return None
-
-        try:
-            dt = datetime.strptime(value, "%Y-%m-%d")
-            # Check if date is within reasonable range (past 50 years, future 10 years)
-            now = datetime.now()
-            if dt.year < now.year - 50 or dt.year > now.year + 10:
-                return f"date_out_of_range: {self.field_name}"
-        except ValueError:
-            return f"invalid_date_format: {self.field_name}"
-
-        return None
+    def validate(self, invoice: Invoice, context: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        dt = _get_date(invoice, self.field_name, context)
+        now_year = context.get("now_year") if context is not None else None
+        if now_year is None:
+            now_year = datetime.now().year
+        return _date_error(dt, now_year, self._format_error, self._range_error)
 
 
 class CurrencyRule(ValidationRule):
     """Validates currency is in known set."""
 
-    ALLOWED_CURRENCIES = {"EUR", "USD", "GBP", "INR", "CHF", "JPY", "AUD", "CAD"}
+    ALLOWED_CURRENCIES = frozenset({"EUR", "USD", "GBP", "INR", "CHF", "JPY", "AUD", "CAD"})
 
     def __init__(self):
         super().__init__(
             "currency_valid",
-            f"Currency must be one of {self.ALLOWED_CURRENCIES}"
+            f"Currency must be one of {', '.join(sorted(self.ALLOWED_CURRENCIES))}"
         )
 
-    def validate(self, invoice: Invoice) -> Optional[str]:
-        if not invoice.currency:
-            return None
-
-        if invoice.currency.upper() not in self.ALLOWED_CURRENCIES:
-            return f"invalid_currency: {invoice.currency}"
-
-        return None
+    def validate(self, invoice: Invoice, context: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        return _currency_error(invoice.currency, self.ALLOWED_CURRENCIES)
 
 
 class AmountSignRule(ValidationRule):
@@ -95,12 +300,10 @@ class AmountSignRule(ValidationRule):
             f"{field_name} must not be negative"
         )
         self.field_name = field_name
+        self._error = f"negative_amount: {field_name}"
 
-    def validate(self, invoice: Invoice) -> Optional[str]:
-        value = getattr(invoice, self.field_name, None)
-        if value is not None and value < 0:
-            return f"negative_amount: {self.field_name}"
-        return None
+    def validate(self, invoice: Invoice, context: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        return _negative_amount_error(getattr(invoice, self.field_name, None), self._error)
 
 
 class TotalConsistencyRule(ValidationRule):
@@ -112,42 +315,31 @@ class TotalConsistencyRule(ValidationRule):
             "gross_total should equal net_total + tax_amount (within 0.01 tolerance)"
         )
 
-    def validate(self, invoice: Invoice) -> Optional[str]:
-        if (invoice.net_total is not None and
-            invoice.tax_amount is not None and
-            invoice.gross_total is not None):
-
-            expected_gross = round(invoice.net_total + invoice.tax_amount, 2)
-            actual_gross = round(invoice.gross_total, 2)
-
-            if abs(expected_gross - actual_gross) > 0.01:
-                return (f"business_rule_failed: totals_mismatch "
-                       f"(expected {expected_gross}, got {actual_gross})")
-
-        return None
+    def validate(self, invoice: Invoice, context: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        return _totals_error(invoice.net_total, invoice.tax_amount, invoice.gross_total)
 
 
 class DueDateRule(ValidationRule):
     """Validates that due_date is on or after invoice_date."""
 
+    uses_context = True
+
     def __init__(self):
         super().__init__(
             "due_date_valid",
-            "due_date must be on or after invoice_date"
+            "due_date must be on or after invoice_date",
+            requires=(
+                "completeness: invoice_date",
+                "date_format: invoice_date",
+                "date_format: due_date",
+            ),
         )
 
-    def validate(self, invoice: Invoice) -> Optional[str]:
-        if invoice.invoice_date and invoice.due_date:
-            try:
-                inv_date = datetime.strptime(invoice.invoice_date, "%Y-%m-%d")
-                due_date = datetime.strptime(invoice.due_date, "%Y-%m-%d")
-
-                if due_date < inv_date:
-                    return "business_rule_failed: due_date_before_invoice_date"
-            except ValueError:
-                pass
-
-        return None
+    def validate(self, invoice: Invoice, context: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        return _due_date_error(
+            _get_date(invoice, "invoice_date", context),
+            _get_date(invoice, "due_date", context),
+        )
 
 
 class LineItemsConsistencyRule(ValidationRule):
@@ -159,38 +351,30 @@ class LineItemsConsistencyRule(ValidationRule):
             "Sum of line_items should equal net_total (if both present)"
         )
 
-    def validate(self, invoice: Invoice) -> Optional[str]:
-        if invoice.line_items and invoice.net_total is not None:
-            items_sum = sum(
-                item.line_total for item in invoice.line_items
-                if item.line_total is not None
-            )
-
-            if items_sum > 0 and abs(items_sum - invoice.net_total) > 0.01:
-                return (f"business_rule_failed: line_items_sum_mismatch "
-                       f"(items sum {items_sum}, net total {invoice.net_total})")
-
-        return None
+    def validate(self, invoice: Invoice, context: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        return _line_items_error(invoice.line_items, invoice.net_total)
 
 
 class TaxIDFormatRule(ValidationRule):
     """Validates tax ID format."""
 
+    _PATTERN = _VAT_RE
+
     def __init__(self, field_name: str):
         super().__init__(
             f"tax_id_format: {field_name}",
             f"{field_name} should match VAT ID format (e.g., DE123456789)"
         )
         self.field_name = field_name
+        self._error = f"invalid_tax_id_format: {field_name}"
 
-    def validate(self, invoice: Invoice) -> Optional[str]:
+    def validate(self, invoice: Invoice, context: Optional[Dict[str, Any]] = None) -> Optional[str]:
         value = getattr(invoice, self.field_name, None)
         if not value:
             return None
 
-        # Simple VAT ID format check: 2 letters + 9-12 digits
-        if not re.match(r"^[A-Z]{2}\d{9,12}$", value):
-            return f"invalid_tax_id_format: {self.field_name}"
+        if not self._PATTERN.match(value):
+            return self._error
 
         return None
 
@@ -204,18 +388,21 @@ class PartyNamesRule(ValidationRule):
             "Seller and buyer must be different entities"
         )
 
-    def validate(self, invoice: Invoice) -> Optional[str]:
-        if (invoice.seller_name and invoice.buyer_name and
-            invoice.seller_name.lower().strip() == invoice.buyer_name.lower().strip()):
-            return "business_rule_failed: seller_and_buyer_same"
-
-        return None
+    def validate(self, invoice: Invoice, context: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        return _parties_error(invoice.seller_name, invoice.buyer_name)
 
 
 class InvoiceValidator:
-    """Main validator that applies all rules."""
+    """
+    Main validator that applies all rules.
+
+    Rules only read attributes, so any object with the Invoice fields (such
+    as the API's Pydantic request models) can be validated directly.
+    """
 
     def __init__(self):
+        # Rules run in this order: presence first, then formats, then the
+        # cross-field business rules, which depend on the earlier ones
         self.rules = [
             # Completeness rules
             CompletenessRule("invoice_number"),
@@ -224,7 +411,7 @@ class InvoiceValidator:
             CompletenessRule("buyer_name"),
 
             # Date format rules
-            DateFormatRule("invoice_date"),
+            DateFormatRule("invoice_date", requires=("completeness: invoice_date",)),
             DateFormatRule("due_date"),
 
             # Currency rule
@@ -241,15 +428,100 @@ class InvoiceValidator:
             LineItemsConsistencyRule(),
             PartyNamesRule(),
         ]
+        # validate_invoice takes the fused _fast_validate path as long as
+        # the rules are left as built here
+        self._default_rules = list(self.rules)
+
+        # The fused paths take their messages from the default rules rather
+        # than repeating them. The allowed currencies are read from the
+        # currency rule on each call, since callers extend the set.
+        (
+            invoice_number_rule, invoice_date_rule, seller_name_rule, buyer_name_rule,
+            invoice_date_format_rule, due_date_format_rule, currency_rule,
+            net_total_rule, tax_amount_rule, gross_total_rule, *_,
+        ) = self._default_rules
+        self._default_messages = (
+            invoice_number_rule._error,
+            invoice_date_rule._error,
+            seller_name_rule._error,
+            buyer_name_rule._error,
+            invoice_date_format_rule._format_error,
+            invoice_date_format_rule._range_error,
+            due_date_format_rule._format_error,
+            due_date_format_rule._range_error,
+            net_total_rule._error,
+            tax_amount_rule._error,
+            gross_total_rule._error,
+        )
+        self._currency_rule = currency_rule
 
     def validate_invoice(self, invoice: Invoice) -> Dict[str, Any]:
         """Validate a single invoice."""
-        errors = []
+        return self._validate_invoice(invoice, datetime.now().year)
 
+    def validate_invoice_fast(self, invoice: Invoice) -> bool:
+        """
+        Whether an invoice passes every rule.
+
+        Stops at the first failing rule, so it is cheaper than
+        validate_invoice when the errors themselves are not needed.
+        """
+        return self._is_valid(invoice, datetime.now().year)
+
+    def _is_valid(self, invoice: Invoice, now_year: int) -> bool:
+        if self.rules == self._default_rules:
+            return self._passes_default_rules(invoice, now_year)
+
+        context = {
+            "dates": {field_name: parse_date_field(invoice, field_name) for field_name in DATE_FIELDS},
+            "now_year": now_year,
+        }
+        # A rule is only skipped when one of its prerequisites failed, and
+        # then the invoice is already invalid
         for rule in self.rules:
-            error = rule.validate(invoice)
-            if error:
-                errors.append(error)
+            if _run_rule(rule, invoice, context):
+                return False
+        return True
+
+    def _passes_default_rules(self, invoice: Invoice, now_year: int) -> bool:
+        """_is_valid for the default rules, leaving the dates for last."""
+        (
+            missing_invoice_number, missing_invoice_date, missing_seller_name, missing_buyer_name,
+            invoice_date_format, invoice_date_range, due_date_format, due_date_range,
+            negative_net_total, negative_tax_amount, negative_gross_total,
+        ) = self._default_messages
+        allowed_currencies = self._currency_rule.ALLOWED_CURRENCIES
+        net_total = invoice.net_total
+        seller_name = invoice.seller_name
+        buyer_name = invoice.buyer_name
+
+        if (
+            _missing_field_error(invoice.invoice_number, missing_invoice_number)
+            or _missing_field_error(invoice.invoice_date, missing_invoice_date)
+            or _missing_field_error(seller_name, missing_seller_name)
+            or _missing_field_error(buyer_name, missing_buyer_name)
+            or _currency_error(invoice.currency, allowed_currencies)
+            or _negative_amount_error(net_total, negative_net_total)
+            or _negative_amount_error(invoice.tax_amount, negative_tax_amount)
+            or _negative_amount_error(invoice.gross_total, negative_gross_total)
+            or _totals_error(net_total, invoice.tax_amount, invoice.gross_total)
+            or _line_items_error(invoice.line_items, net_total)
+            or _parties_error(seller_name, buyer_name)
+        ):
+            return False
+
+        # Parsing is the most expensive check. The due date rule only runs
+        # once both dates are known to be valid, as its prerequisites say.
+        invoice_dt = parse_date_field(invoice, "invoice_date")
+        due_dt = parse_date_field(invoice, "due_date")
+        return not (
+            _date_error(invoice_dt, now_year, invoice_date_format, invoice_date_range)
+            or _date_error(due_dt, now_year, due_date_format, due_date_range)
+            or _due_date_error(invoice_dt, due_dt)
+        )
+
+    def _validate_invoice(self, invoice: Invoice, now_year: int, rules: Optional[List[ValidationRule]] = None) -> Dict[str, Any]:
+        errors = self._invoice_errors(invoice, now_year, rules)
 
         invoice_id = invoice.invoice_number or "UNKNOWN"
 
@@ -259,23 +531,229 @@ class InvoiceValidator:
             "errors": errors,
         }
 
-    def validate_invoices(self, invoices: List[Invoice]) -> Dict[str, Any]:
-        """Validate a list of invoices and return summary."""
-        results = []
-        error_counts = defaultdict(int)
+    def _invoice_errors(self, invoice: Invoice, now_year: int, rules: Optional[List[ValidationRule]] = None) -> List[str]:
+        if rules is None and self.rules == self._default_rules:
+            return self._fast_validate(invoice, now_year)
+        return self._apply_rules(invoice, now_year, self.rules if rules is None else rules)
 
-        for invoice in invoices:
-            result = self.validate_invoice(invoice)
-            results.append(result)
+    def _apply_rules(self, invoice: Invoice, now_year: int, rules: List[ValidationRule]) -> List[str]:
+        errors = []
 
-            for error in result["errors"]:
-                error_counts[error] += 1
+        # Parse each date once for all the rules that look at it
+        context = {
+            "dates": {field_name: parse_date_field(invoice, field_name) for field_name in DATE_FIELDS},
+            "now_year": now_year,
+        }
+
+        failed = set()
+        for rule in rules:
+            # Skip rules whose prerequisites already reported an error
+            if rule.requires and not rule.requires.isdisjoint(failed):
+                continue
+            error = _run_rule(rule, invoice, context)
+            if error:
+                errors.append(error)
+                failed.add(rule.name)
+
+        return errors
+
+    def _apply_rules_columnwise(self, invoices: List[Invoice], now_year: int) -> List[List[str]]:
+        """
+        Errors of each invoice, like _apply_rules, with each rule applied to
+        the whole batch at once through ValidationRule.apply.
+        """
+        if not self.rules:
+            return [[] for _ in invoices]
+
+        columns = _extract_columns(invoices, now_year)
+        rule_errors = []
+        # Per rule name, whether each row reported an error
+        failed = {}
+        for rule in self.rules:
+            skip = None
+            if rule.requires:
+                prerequisites = [failed[name] for name in rule.requires if name in failed]
+                if prerequisites:
+                    skip = list(map(any, zip(*prerequisites)))
+
+            errors = rule.apply(columns, skip)
+            if skip is not None:
+                errors = [None if skipped else error for error, skipped in zip(errors, skip)]
+            rule_errors.append(errors)
+
+            previous = failed.get(rule.name)
+            if previous is None:
+                failed[rule.name] = errors
+            else:
+                failed[rule.name] = [a or b for a, b in zip(previous, errors)]
+
+        return [[error for error in row if error] for row in zip(*rule_errors)]
+
+    def _fast_validate(self, invoice: Invoice, now_year: int) -> List[str]:
+        """
+        Apply the default rules in a single pass over the invoice.
+
+        Same errors, in the same order and with the same prerequisites, as
+        running the rules built by __init__, but each field is read once and
+        there is no per-rule dispatch.
+        """
+        (
+            missing_invoice_number, missing_invoice_date, missing_seller_name, missing_buyer_name,
+            invoice_date_format, invoice_date_range, due_date_format, due_date_range,
+            negative_net_total, negative_tax_amount, negative_gross_total,
+        ) = self._default_messages
+        allowed_currencies = self._currency_rule.ALLOWED_CURRENCIES
+        invoice_dt = parse_date_field(invoice, "invoice_date")
+        due_dt = parse_date_field(invoice, "due_date")
+        seller_name = invoice.seller_name
+        buyer_name = invoice.buyer_name
+        net_total = invoice.net_total
+        tax_amount = invoice.tax_amount
+        gross_total = invoice.gross_total
+
+        invoice_date_missing = _missing_field_error(invoice.invoice_date, missing_invoice_date)
+        invoice_date_error = None if invoice_date_missing else _date_error(
+            invoice_dt, now_year, invoice_date_format, invoice_date_range)
+        due_date_error = _date_error(due_dt, now_year, due_date_format, due_date_range)
+        due_date_checked = not (invoice_date_missing or invoice_date_error or due_date_error)
+
+        errors = (
+            _missing_field_error(invoice.invoice_number, missing_invoice_number),
+            invoice_date_missing,
+            _missing_field_error(seller_name, missing_seller_name),
+            _missing_field_error(buyer_name, missing_buyer_name),
+            invoice_date_error,
+            due_date_error,
+            _currency_error(invoice.currency, allowed_currencies),
+            _negative_amount_error(net_total, negative_net_total),
+            _negative_amount_error(tax_amount, negative_tax_amount),
+            _negative_amount_error(gross_total, negative_gross_total),
+            _totals_error(net_total, tax_amount, gross_total),
+            _due_date_error(invoice_dt, due_dt) if due_date_checked else None,
+            _line_items_error(invoice.line_items, net_total),
+            _parties_error(seller_name, buyer_name),
+        )
+        return [error for error in errors if error]
+
+    def validate_invoices(
+        self,
+        invoices: List[Invoice],
+        *,
+        return_results: bool = True,
+        fast_invalid_count_only: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Validate a list of invoices and return summary.
+
+        With return_results=False the summary has only the counts, without
+        the per-invoice "results", which are then never built. With
+        fast_invalid_count_only=True it has only the invoice counts: each
+        invoice is checked with validate_invoice_fast, which stops at its
+        first error, so there are no "error_counts" either.
+        """
+        # The current year bounds the date range check; read the clock once
+        # per batch rather than once per date
+        now_year = datetime.now().year
+
+        if fast_invalid_count_only:
+            valid_count = sum(1 for invoice in invoices if self._is_valid(invoice, now_year))
+            return {
+                "total_invoices": len(invoices),
+                "valid_invoices": valid_count,
+                "invalid_invoices": len(invoices) - valid_count,
+            }
+
+        if self.rules == self._default_rules:
+            error_lists = (self._fast_validate(invoice, now_year) for invoice in invoices)
+        else:
+            # Other rule lists are applied rule by rule over columns of the
+            # batch rather than invoice by invoice
+            error_lists = self._apply_rules_columnwise(invoices, now_year)
+
+        if return_results:
+            results = [
+                {
+                    "invoice_id": invoice.invoice_number or "UNKNOWN",
+                    "is_valid": not errors,
+                    "errors": errors,
+                }
+                for invoice, errors in zip(invoices, error_lists)
+            ]
+            return self._summarize(results)
+
+        valid_count = 0
+        error_counts = Counter()
+        for errors in error_lists:
+            if errors:
+                error_counts.update(errors)
+            else:
+                valid_count += 1
+
+        return {
+            "total_invoices": len(invoices),
+            "valid_invoices": valid_count,
+            "invalid_invoices": len(invoices) - valid_count,
+            "error_counts": dict(error_counts),
+        }
+
+    def validate_invoices_parallel(self, invoices: List[Invoice], max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Validate a list of invoices like validate_invoices, split across a
+        pool of workers (one per CPU unless max_workers is given).
+
+        Worker processes get a copy of this validator once, when they start,
+        and validate chunks of the list; on free-threaded Python builds the
+        chunks go to threads instead. Only worth it for large batches, since
+        the invoices and results have to be sent between processes.
+        """
+        workers = min(max_workers or os.cpu_count() or 1, len(invoices))
+        if workers <= 1:
+            return self.validate_invoices(invoices)
+
+        now_year = datetime.now().year
+        chunk_size = max(1, len(invoices) // (workers * 4))
+        chunks = [invoices[i:i + chunk_size] for i in range(0, len(invoices), chunk_size)]
+
+        if _gil_disabled():
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                chunk_results = list(pool.map(partial(_validate_chunk, self), chunks, repeat(now_year)))
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_validator_worker,
+                initargs=(self,),
+            ) as pool:
+                chunk_results = list(pool.map(_validate_chunk_worker, chunks, repeat(now_year)))
+
+        # Chunks come back in order, so the merged counts keep the order in
+        # which errors first occur, as in validate_invoices. Each worker
+        # counts its valid invoices while validating them, so the merged
+        # results are not walked again for the count.
+        results = []
+        valid_count = 0
+        error_counts = Counter()
+        for chunk_result, chunk_valid_count, chunk_counts in chunk_results:
+            results.extend(chunk_result)
+            valid_count += chunk_valid_count
+            error_counts.update(chunk_counts)
+
+        return self._summarize(results, error_counts, valid_count)
+
+    def _summarize(
+        self,
+        results: List[Dict[str, Any]],
+        error_counts: Optional[Dict[str, int]] = None,
+        valid_count: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        if error_counts is None:
+            error_counts = _count_errors(results)
+        if valid_count is None:
+            valid_count = sum(1 for r in results if r["is_valid"])
 
-        valid_count = sum(1 for r in results if r["is_valid"])
         invalid_count = len(results) - valid_count
 
         summary = {
-            "total_invoices": len(invoices),
+            "total_invoices": len(results),
             "valid_invoices": valid_count,
             "invalid_invoices": invalid_count,
             "error_counts": dict(error_counts),
@@ -285,7 +763,100 @@ class InvoiceValidator:
         return summary
 
 
-def validate_invoices(invoices: List[Invoice]) -> Dict[str, Any]:
+def _extract_columns(invoices: List[Invoice], now_year: int) -> Dict[str, Any]:
+    """
+    Column store of a batch for ValidationRule.apply.
+
+    Field values and parsed dates are gathered into lists on first use (see
+    _column and _date_column), so only the fields the rules read are
+    extracted, each in a single pass over the invoices.
+    """
+    return {"invoices": invoices, "now_year": now_year, "fields": {}, "dates": {}}
+
+
+def _column(columns: Dict[str, Any], field_name: str) -> list:
+    """Values of a field for every invoice of the batch, None if missing."""
+    values = columns["fields"].get(field_name)
+    if values is None:
+        values = columns["fields"][field_name] = _gather(columns["invoices"], field_name)
+    return values
+
+
+def _date_column(columns: Dict[str, Any], field_name: str) -> list:
+    """Parsed values of a date field for every invoice (see parse_date_field)."""
+    dates = columns["dates"].get(field_name)
+    if dates is None:
+        dates = columns["dates"][field_name] = list(map(_parse_date, _column(columns, field_name)))
+    return dates
+
+
+def _gather(invoices: List[Invoice], field_name: str) -> list:
+    try:
+        # map with attrgetter gathers the column in a single C-level loop
+        return list(map(attrgetter(field_name), invoices))
+    except AttributeError:
+        return [getattr(invoice, field_name, None) for invoice in invoices]
+
+
+def _count_errors(results: List[Dict[str, Any]]) -> Counter:
+    """Occurrences of each error message, in order of first occurrence."""
+    # A single Counter over all the error lists counts in C; updating it
+    # once per result would cost a Python-level call per invoice
+    return Counter(chain.from_iterable(map(itemgetter("errors"), results)))
+
+
+def _gil_disabled() -> bool:
+    """Whether this is a free-threaded Python build running without the GIL."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def _validate_chunk(validator: InvoiceValidator, invoices: List[Invoice], now_year: int):
+    """Results, valid count and error counts for one chunk of validate_invoices_parallel."""
+    results = []
+    valid_count = 0
+    for invoice in invoices:
+        result = validator._validate_invoice(invoice, now_year)
+        valid_count += result["is_valid"]
+        results.append(result)
+    return results, valid_count, _count_errors(results)
+
+
+# Validator owned by each process-pool worker, see validate_invoices_parallel
+_worker_validator: Optional[InvoiceValidator] = None
+
+
+def _init_validator_worker(validator: InvoiceValidator) -> None:
+    global _worker_validator
+    _worker_validator = validator
+
+
+def _validate_chunk_worker(invoices: List[Invoice], now_year: int):
+    return _validate_chunk(_worker_validator, invoices, now_year)
+
+
+# Validator shared by validate_invoices and the API. Rules are stateless, so
+# one instance can serve every caller and thread.
+_DEFAULT_VALIDATOR: Optional[InvoiceValidator] = None
+
+
+def get_validator() -> InvoiceValidator:
+    """Return the shared InvoiceValidator, creating it on first call."""
+    global _DEFAULT_VALIDATOR
+    if _DEFAULT_VALIDATOR is None:
+        _DEFAULT_VALIDATOR = InvoiceValidator()
+    return _DEFAULT_VALIDATOR
+
+
+def validate_invoices(
+    invoices: List[Invoice],
+    *,
+    return_results: bool = True,
+    fast_invalid_count_only: bool = False,
+) -> Dict[str, Any]:
     """Convenience function to validate invoices."""
-    validator = InvoiceValidator()
-    return validator.validate_invoices(invoices)
+    return get_validator().validate_invoices(
+        invoices,
+        return_results=return_results,
+        fast_invalid_count_only=fast_invalid_count_only,
+    )
@@ -0,0 +1,39 @@
+import os
+from pathlib import Path
+
+import pytest
+
+import api
+from invoice_qc import extractor as extractor_module
+from invoice_qc.extractor import get_extractor
+
+
+SAMPLE_PDF = str(Path(__file__).resolve().parent.parent / "pdfs" / "invoice (1).pdf")
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    # Workers read the variable when they import the extractor
+    monkeypatch.setenv("INVOICE_QC_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(extractor_module, "CACHE_DIR", tmp_path)
+
+
+def test_broken_extraction_pool_is_replaced():
+    pool = api._create_extract_pool()
+    api.app.state.extract_pool = pool
+    try:
+        # A worker dying breaks the whole pool
+        pool.submit(os._exit, 1).exception()
+
+        invoices = api.extract_pdfs([SAMPLE_PDF, SAMPLE_PDF])
+
+        assert len(invoices) == 2
+        assert api.app.state.extract_pool is not pool
+    finally:
+        api.app.state.extract_pool.shutdown()
+        api.app.state.extract_pool = None
+
+
+def test_extract_pdfs_without_pool():
+    api.app.state.extract_pool = None
+    assert api.extract_pdfs([SAMPLE_PDF]) == [get_extractor().extract_from_pdf(SAMPLE_PDF)]
@@ -0,0 +1,160 @@
+from pathlib import Path
+
+import pytest
+
+from invoice_qc import extractor as extractor_module
+from invoice_qc.extractor import InvoiceExtractor
+from invoice_qc.schema import Invoice
+
+
+SAMPLE_PDF = Path(__file__).resolve().parent.parent / "pdfs" / "invoice (1).pdf"
+
+
+PAGE_1 = """Invoice Number: INV-100
+Seller: Acme GmbH
+Buyer: Beta Ltd
+Gross: 119.00
+Widget 2 x 10.00 = 20.00
+"""
+
+PAGE_2 = """Invoice Date: 05.01.2024
+Due Date: 05.02.2024
+Net Total: 100.00
+VAT: 19.00
+Gadget 1 x 80.00 = 80.00
+"""
+
+
+def test_later_pages_are_read_until_fields_and_line_items_are_complete(monkeypatch):
+    extractor = InvoiceExtractor(use_cache=False)
+    monkeypatch.setattr(extractor, "_iter_page_texts", lambda pdf_path: iter([PAGE_1, PAGE_2]))
+
+    invoice = extractor._parse_pdf("unused.pdf")
+
+    assert invoice.invoice_number == "INV-100"
+    assert invoice.invoice_date is not None
+    assert invoice.due_date is not None
+    assert invoice.net_total == 100.0
+    assert invoice.tax_amount == 19.0
+    assert [item.description for item in invoice.line_items] == ["Widget", "Gadget"]
+
+
+def test_labelled_values_on_later_pages_win_over_fallbacks(monkeypatch):
+    extractor = InvoiceExtractor(use_cache=False)
+    pages = [
+        "Acme GmbH\nPrinted 01.01.2024\nInvoice No: INV-7\n",
+        "Invoice Date: 05.01.2024\nDue Date: 05.02.2024\nSeller: Zeta Corp\n",
+    ]
+    monkeypatch.setattr(extractor, "_iter_page_texts", lambda pdf_path: iter(pages))
+
+    invoice = extractor._parse_pdf("unused.pdf")
+
+    assert invoice.invoice_date == "2024-01-05"
+    assert invoice.due_date == "2024-02-05"
+    assert invoice.seller_name == "Zeta Corp"
+    assert invoice == extractor.parse_invoice_text("".join(pages))
+
+
+def test_fallbacks_apply_when_no_page_is_labelled(monkeypatch):
+    extractor = InvoiceExtractor(use_cache=False)
+    pages = ["Acme GmbH\nPrinted 01.01.2024\n", "Page 2 of 2\n"]
+    monkeypatch.setattr(extractor, "_iter_page_texts", lambda pdf_path: iter(pages))
+
+    invoice = extractor._parse_pdf("unused.pdf")
+
+    assert invoice.invoice_date == invoice.due_date == "2024-01-01"
+    assert invoice.seller_name == "Acme GmbH"
+    assert invoice == extractor.parse_invoice_text("".join(pages))
+
+
+def test_sample_pdf_fields_under_default_backend():
+    extractor = InvoiceExtractor(use_cache=False)
+    assert extractor.pdf_backend == "pdfplumber"
+
+    invoice = extractor.extract_from_pdf(str(SAMPLE_PDF))
+
+    assert invoice.invoice_number == "/Bill"
+    assert invoice.invoice_date == "2025-11-15"
+    assert invoice.due_date == "2025.11.14"
+    assert invoice.seller_name == "Services Private Limited Bhumika Vasanth"
+    assert invoice.buyer_name == "tal Amount"
+    assert invoice.currency == "INR"
+    assert (invoice.net_total, invoice.tax_amount, invoice.gross_total) == (1.0, None, 0.76)
+    assert len(invoice.line_items) == 3
+
+
+def _cached_extractor(monkeypatch, tmp_path, calls):
+    monkeypatch.setattr(extractor_module, "CACHE_DIR", tmp_path)
+    extractor_module._read_cache_entry.cache_clear()
+    extractor = InvoiceExtractor()
+
+    def parse(pdf_path):
+        calls.append(pdf_path)
+        return Invoice(invoice_number="INV-100", net_total=100.0)
+
+    monkeypatch.setattr(extractor, "_parse_pdf", parse)
+    return extractor
+
+
+def test_cache_serves_a_pdf_extracted_before(monkeypatch, tmp_path):
+    calls = []
+    extractor = _cached_extractor(monkeypatch, tmp_path, calls)
+
+    first = extractor.extract_from_pdf(SAMPLE_PDF)
+    second = extractor.extract_from_pdf(SAMPLE_PDF)
+
+    assert calls == [SAMPLE_PDF]
+    assert first == second
+
+
+def test_cache_misses_on_different_contents(monkeypatch, tmp_path):
+    calls = []
+    extractor = _cached_extractor(monkeypatch, tmp_path, calls)
+    other_pdf = tmp_path / "other.pdf"
+    other_pdf.write_bytes(SAMPLE_PDF.read_bytes() + b"\n")
+
+    extractor.extract_from_pdf(SAMPLE_PDF)
+    extractor.extract_from_pdf(other_pdf)
+
+    assert calls == [SAMPLE_PDF, other_pdf]
+
+
+def test_cache_is_bypassed_when_disabled(monkeypatch, tmp_path):
+    calls = []
+    extractor = _cached_extractor(monkeypatch, tmp_path, calls)
+    extractor.use_cache = False
+
+    extractor.extract_from_pdf(SAMPLE_PDF)
+    extractor.extract_from_pdf(SAMPLE_PDF)
+
+    assert calls == [SAMPLE_PDF, SAMPLE_PDF]
+    assert not list(tmp_path.rglob("*.json"))
+
+
+def test_corrupt_cache_entry_is_a_miss(monkeypatch, tmp_path):
+    calls = []
+    extractor = _cached_extractor(monkeypatch, tmp_path, calls)
+    extractor.extract_from_pdf(SAMPLE_PDF)
+    (entry,) = tmp_path.rglob("*.json")
+    entry.write_bytes(b'{"net_total": "oops"}')
+    extractor_module._read_cache_entry.cache_clear()
+
+    invoice = extractor.extract_from_pdf(SAMPLE_PDF)
+
+    assert invoice.net_total == 100.0
+    assert calls == [SAMPLE_PDF, SAMPLE_PDF]
+    assert extractor_module.msgspec.json.decode(entry.read_bytes(), type=Invoice) == invoice
+
+
+@pytest.mark.skipif(extractor_module.hyperscan is None, reason="hyperscan is not installed")
+def test_prefilter_does_not_change_the_parse():
+    extractor = InvoiceExtractor(use_cache=False)
+    assert extractor._prefilter is not None
+    # re treats the separators U+001C to U+001F as whitespace
+    text = "Invoice Number: INV-100\nGross:\x1c12.50\nNet Total:\x1d10.00\nVAT\x1e2.50\nRate\x1f25 %\n"
+
+    with_prefilter = extractor.parse_invoice_text(text)
+    extractor._prefilter = None
+
+    assert with_prefilter == extractor.parse_invoice_text(text)
+    assert with_prefilter.gross_total == 12.5
@@ -0,0 +1,164 @@
+import random
+
+from invoice_qc.schema import Invoice, LineItem
+from invoice_qc.validator import AmountSignRule, CurrencyRule, InvoiceValidator, ValidationRule
+
+
+def make_invoice(**fields):
+    values = dict(
+        invoice_number="INV-1",
+        invoice_date="2024-01-05",
+        due_date="2024-02-05",
+        seller_name="Acme GmbH",
+        buyer_name="Beta Ltd",
+        currency="EUR",
+        net_total=100.0,
+        tax_amount=19.0,
+        gross_total=119.0,
+    )
+    values.update(fields)
+    return Invoice(**values)
+
+
+class ReferenceRule(ValidationRule):
+    """Custom rule written against the documented one-argument contract."""
+
+    def __init__(self):
+        super().__init__("reference_present", "Invoice must have an external reference")
+
+    def validate(self, invoice):
+        if not invoice.external_reference:
+            return "missing_field: external_reference"
+        return None
+
+
+def test_one_argument_custom_rule():
+    validator = InvoiceValidator()
+    validator.rules.append(ReferenceRule())
+    invoice = make_invoice()
+
+    assert validator.validate_invoice(invoice)["errors"] == ["missing_field: external_reference"]
+    assert validator.validate_invoice_fast(invoice) is False
+
+    summary = validator.validate_invoices([invoice, make_invoice(external_reference="PO-7")])
+    assert [r["errors"] for r in summary["results"]] == [["missing_field: external_reference"], []]
+
+
+class StrictCurrencyRule(CurrencyRule):
+    """Subclass that only overrides validate."""
+
+    def validate(self, invoice):
+        if invoice.currency != "EUR":
+            return "not_eur"
+        return None
+
+
+def test_validate_invoice_and_validate_invoices_agree_for_subclassed_rule():
+    validator = InvoiceValidator()
+    validator.rules = [
+        StrictCurrencyRule() if isinstance(rule, CurrencyRule) else rule
+        for rule in validator.rules
+    ]
+    invoices = [
+        make_invoice(currency="USD"),
+        make_invoice(currency="EUR"),
+        make_invoice(currency="usd", invoice_date="2024-13-01", tax_amount=-1.0),
+        make_invoice(invoice_number=None, seller_name="Beta Ltd"),
+    ]
+
+    summary = validator.validate_invoices(invoices)
+    assert summary["results"][0]["errors"] == ["not_eur"]
+    assert summary["results"] == [validator.validate_invoice(invoice) for invoice in invoices]
+
+
+def test_allowed_currencies_are_read_when_validating(monkeypatch):
+    invoice = make_invoice(currency="SEK")
+    validator = InvoiceValidator()
+    assert validator.validate_invoice(invoice)["errors"] == ["invalid_currency: SEK"]
+
+    currency_rule = next(rule for rule in validator.rules if isinstance(rule, CurrencyRule))
+    currency_rule.ALLOWED_CURRENCIES = CurrencyRule.ALLOWED_CURRENCIES | {"SEK"}
+    assert validator.validate_invoice(invoice)["errors"] == []
+    assert validator.validate_invoice_fast(invoice) is True
+    assert validator.validate_invoices([invoice])["valid_invoices"] == 1
+
+    validator = InvoiceValidator()
+    monkeypatch.setattr(CurrencyRule, "ALLOWED_CURRENCIES", frozenset({"NOK"}))
+    assert validator.validate_invoice(invoice)["errors"] == ["invalid_currency: SEK"]
+    assert validator.validate_invoice_fast(make_invoice(currency="NOK")) is True
+    assert validator.validate_invoices([make_invoice(currency="EUR")])["valid_invoices"] == 0
+
+
+def test_amount_rules_in_custom_list_match_per_invoice_results():
+    validator = InvoiceValidator()
+    validator.rules.append(AmountSignRule("tax_rate"))
+    invoices = [
+        make_invoice(tax_rate=-19.0),
+        make_invoice(tax_amount=-1.0, gross_total=99.0),
+        make_invoice(net_total=None),
+        make_invoice(tax_rate=19.0),
+    ]
+
+    summary = validator.validate_invoices(invoices)
+    assert summary["results"][0]["errors"] == ["negative_amount: tax_rate"]
+    assert summary["results"] == [validator.validate_invoice(invoice) for invoice in invoices]
+
+
+def test_line_items_summing_to_zero_or_less_are_checked():
+    validator = InvoiceValidator()
+    zero = make_invoice(line_items=[LineItem(line_total=50.0), LineItem(line_total=-50.0)])
+    negative = make_invoice(line_items=[LineItem(line_total=-10)])
+    no_totals = make_invoice(line_items=[LineItem(description="Widget")])
+
+    assert validator.validate_invoice(zero)["errors"] == [
+        "business_rule_failed: line_items_sum_mismatch (items sum 0.0, net total 100.0)"
+    ]
+    assert validator.validate_invoice(negative)["errors"] == [
+        "business_rule_failed: line_items_sum_mismatch (items sum -10, net total 100.0)"
+    ]
+    assert validator.validate_invoice(no_totals)["errors"] == []
+
+
+class NoopRule(ValidationRule):
+    def __init__(self):
+        super().__init__("noop", "Never fails")
+
+    def validate(self, invoice):
+        return None
+
+
+def random_invoice(rng):
+    pick = rng.choice
+    return make_invoice(
+        invoice_number=pick(["INV-1", None, "", "  "]),
+        invoice_date=pick(["2024-01-05", "2024-02-30", "1900-01-01", "05.01.2024", None, ""]),
+        due_date=pick(["2024-02-05", "2023-12-01", "2100-01-01", "soon", None]),
+        seller_name=pick(["Acme GmbH", "Beta Ltd", "ACME GMBH", None, ""]),
+        buyer_name=pick(["Beta Ltd", "Acme GmbH", None]),
+        currency=pick(["EUR", "usd", "XYZ", None, ""]),
+        net_total=pick([100.0, 100, -5.0, 0.1, None]),
+        tax_amount=pick([19.0, 19, -1.0, 0.2, None]),
+        gross_total=pick([119.0, 119, 0.3, 120.0, None]),
+        line_items=[LineItem(line_total=pick([50.0, 50, -50.0, 0.1, None])) for _ in range(rng.randrange(4))],
+    )
+
+
+def test_fused_and_per_rule_paths_agree_on_random_invoices():
+    rng = random.Random(1234)
+    invoices = [random_invoice(rng) for _ in range(2000)]
+
+    validator = InvoiceValidator()
+    # An extra rule moves validation off the fused paths
+    per_rule = InvoiceValidator()
+    per_rule.rules.append(NoopRule())
+
+    fused = validator.validate_invoices(invoices)
+    assert per_rule.validate_invoices(invoices) == fused
+    assert validator.validate_invoices_parallel(invoices, max_workers=2) == fused
+    assert [per_rule.validate_invoice(invoice) for invoice in invoices] == fused["results"]
+
+    is_valid = [result["is_valid"] for result in fused["results"]]
+    assert [validator.validate_invoice_fast(invoice) for invoice in invoices] == is_valid
+    assert [per_rule.validate_invoice_fast(invoice) for invoice in invoices] == is_valid
+    assert validator.validate_invoices(invoices, fast_invalid_count_only=True)["valid_invoices"] == sum(is_valid)
+    assert 0 < sum(is_valid) < len(invoices)